@@ -10,13 +10,16 @@ Main functions:
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import aiohttp
 
 from app.config import settings
 from app.models import HealthResult
 
+# Prometheus label values must have backslash, double quote and newline escaped
+_LABEL_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
 
 class HealthChecker:
     """Async health checker for multiple services.
@@ -31,14 +34,91 @@ class HealthChecker:
     def __init__(self) -> None:
         """Initialize checker with settings from config."""
         self.services = settings.services
+        # Service list is static - freeze (name, url) pairs once
+        self._service_items: tuple[tuple[str, str], ...] = tuple(self.services.items())
+        # Static HealthResult fields per service - built once, reused every check
+        self._templates: dict[str, dict[str, str]] = {
+            name: {"service_name": name, "url": url}
+            for name, url in self._service_items
+        }
+        # Prometheus line prefixes per service (label escaped and encoded once)
+        self.prom_up_prefix: dict[str, bytes] = {}
+        self.prom_rt_prefix: dict[str, bytes] = {}
+        for name in self.services:
+            label = name.translate(_LABEL_ESCAPE)
+            self.prom_up_prefix[name] = f'service_up{{service="{label}"}} '.encode()
+            self.prom_rt_prefix[name] = (
+                f'service_response_time_ms{{service="{label}"}} '.encode()
+            )
         self.timeout = aiohttp.ClientTimeout(total=settings.request_timeout_seconds)
         self._cache: list[HealthResult] = []
-        self._cache_time: datetime | None = None
-        self._cache_ttl = timedelta(seconds=5)  # Cache for 5 seconds
+        # Absolute cache expiry on monotonic loop clock (immune to clock changes)
+        self._cache_deadline: float = 0.0
+        self._cache_ttl = 5.0  # Cache for 5 seconds
+        self.open()
+
+    def open(self) -> None:
+        """Reset per-run state (called on application startup).
+
+        Checker is a module-level singleton - this lets it be reused
+        after aclose(), e.g. by a second app lifespan.
+        """
+        # Refresh in progress - concurrent cache misses wait for this one
+        self._refresh_task: asyncio.Task[list[HealthResult]] | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+        # Limit checks in flight (protects DNS resolver and connector).
+        # Semaphore binds to the event loop it is first used in - new per run.
+        self._sem = asyncio.Semaphore(settings.max_concurrent_checks)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return shared HTTP session, creating it on first use.
+
+        One session is reused by all checks, so connections to each host
+        are pooled and kept alive between check cycles instead of paying
+        TCP + TLS handshake on every request. Idle connections are kept
+        for 5 minutes (aiohttp default is 15s), so they survive the pause
+        between periodic checks. Service hosts are fixed, so resolved
+        addresses are cached for an hour - reconnects skip DNS lookup.
+        """
+        if self._closed:
+            raise RuntimeError("HealthChecker is closed")
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    limit_per_host=64,
+                    use_dns_cache=True,
+                    ttl_dns_cache=3600,
+                    keepalive_timeout=300,
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Stop running refresh and close shared HTTP session.
+
+        Called on application shutdown. Refresh is shielded from its callers,
+        so it must be cancelled here - otherwise it would keep using
+        the session after it is closed.
+        """
+        self._closed = True
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        if self._session:
+            await self._session.close()
 
     async def check_service(self, name: str, url: str) -> HealthResult:
         """Check health of a single service.
 
+        Results are built with model_construct() - all fields come from
+        this method, so Pydantic validation is skipped.
+
         Args:
             name: Service name (e.g., "github")
             url: URL to check (e.g., "https://api.github.com")
@@ -46,31 +126,44 @@ class HealthChecker:
         Returns:
             HealthResult with service status information
         """
-        start_time = datetime.now()
+        # Monotonic event loop clock - immune to wall-clock jumps (NTP, DST)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        # Ad-hoc call (unknown service or different URL) - build static fields
+        static = self._templates.get(name)
+        if static is None or static["url"] != url:
+            static = {"service_name": name, "url": url}
 
         try:
-            # Create HTTP session and execute request
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            # Execute request using shared (pooled) HTTP session.
+            # HEAD is enough to get status code - no body is transferred.
+            session = await self._get_session()
+            async with session.head(url, allow_redirects=True) as response:
+                status = response.status
+
+            # Some servers don't support HEAD - fall back to GET
+            if status in (405, 501):
                 async with session.get(url) as response:
-                    # Calculate response time in milliseconds
-                    elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-                    return HealthResult(
-                        service_name=name,
-                        url=url,
-                        is_healthy=response.status < 400,  # 2xx and 3xx = OK
-                        status_code=response.status,
-                        response_time_ms=round(elapsed_ms, 2),
-                        error_message=None,
-                        checked_at=datetime.now(),
-                    )
+                    status = response.status
+
+            # Calculate response time in milliseconds
+            elapsed_ms = (loop.time() - start) * 1000
+
+            return HealthResult.model_construct(
+                **static,
+                is_healthy=status < 400,  # 2xx and 3xx = OK
+                status_code=status,
+                response_time_ms=round(elapsed_ms, 2),
+                error_message=None,
+                checked_at=datetime.now(),
+            )
 
         except TimeoutError:
             # Service did not respond in time
-            elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-            return HealthResult(
-                service_name=name,
-                url=url,
+            elapsed_ms = (loop.time() - start) * 1000
+            return HealthResult.model_construct(
+                **static,
                 is_healthy=False,
                 status_code=None,
                 response_time_ms=round(elapsed_ms, 2),
@@ -80,10 +173,9 @@ class HealthChecker:
 
         except aiohttp.ClientError as e:
             # Connection error (DNS, refused, etc.)
-            elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
-            return HealthResult(
-                service_name=name,
-                url=url,
+            elapsed_ms = (loop.time() - start) * 1000
+            return HealthResult.model_construct(
+                **static,
                 is_healthy=False,
                 status_code=None,
                 response_time_ms=round(elapsed_ms, 2),
@@ -91,6 +183,11 @@ class HealthChecker:
                 checked_at=datetime.now(),
             )
 
+    async def _bounded_check(self, name: str, url: str) -> HealthResult:
+        """Check single service, waiting for a free concurrency slot."""
+        async with self._sem:
+            return await self.check_service(name, url)
+
     async def check_all(self, force: bool = False) -> list[HealthResult]:
         """Check all configured services with optional caching.
 
@@ -98,22 +195,32 @@ class HealthChecker:
             force: Forces check, ignoring cache
         """
         # If cache exists and is not expired, return from cache
-        if not force and self._cache and self._cache_time:
-            if datetime.now() - self._cache_time < self._cache_ttl:
-                return self._cache
+        loop = asyncio.get_running_loop()
+        if not force and self._cache and loop.time() < self._cache_deadline:
+            return self._cache
 
-        if not self.services:
+        if not self._service_items:
             return []
 
+        # Single-flight: start refresh only if none is running, otherwise
+        # join it (no await between check and create - no lock needed)
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+
+        # Shield - a cancelled caller must not cancel refresh for the others
+        return await asyncio.shield(self._refresh_task)
+
+    async def _do_refresh(self) -> list[HealthResult]:
+        """Check all services and update cache."""
         # Create list of tasks - each checks one service
-        tasks = [self.check_service(name, url) for name, url in self.services.items()]
+        tasks = [self._bounded_check(name, url) for name, url in self._service_items]
 
-        # Execute all tasks in parallel
+        # Execute all tasks in parallel (at most max_concurrent_checks at once)
         results = await asyncio.gather(*tasks)
 
         # Update cache
         self._cache = list(results)
-        self._cache_time = datetime.now()
+        self._cache_deadline = asyncio.get_running_loop().time() + self._cache_ttl
 
         return self._cache
 
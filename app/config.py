@@ -1,6 +1,11 @@
 """Application configuration using Pydantic Settings."""
 
-from pydantic import field_validator
+import sys
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -12,23 +17,29 @@ class Settings(BaseSettings):
     debug: bool = False
 
     # Health check settings
-    check_interval_seconds: int = 60
+    check_interval_seconds: int = Field(default=60, ge=1)
     request_timeout_seconds: int = 10
+    # At least 1 - Semaphore(0) would block all checks forever
+    max_concurrent_checks: int = Field(default=64, ge=1)
 
     # Services to monitor (format: "name=url,name2=url2")
     services_config: str = "github=https://api.github.com,google=https://www.google.com"
 
-    @property
-    def services(self) -> dict[str, str]:
-        """Parse services config string into dictionary."""
+    @cached_property
+    def services(self) -> Mapping[str, str]:
+        """Parse services config string into read-only mapping (parsed once).
+
+        Service list is static for the whole process - names are interned,
+        so comparisons and dict lookups by name hit the identity fast path.
+        """
         result: dict[str, str] = {}
-        if not self.services_config:
-            return result
-        for item in self.services_config.split(","):
-            if "=" in item:
-                name, url = item.split("=", 1)
-                result[name.strip()] = url.strip()
-        return result
+        if self.services_config:
+            for item in self.services_config.split(","):
+                # partition returns empty separator when "=" is missing
+                name, sep, url = item.partition("=")
+                if sep and (name := name.strip()) and (url := url.strip()):
+                    result[sys.intern(name)] = url
+        return MappingProxyType(result)
 
     @field_validator("services_config")
     @classmethod
@@ -39,12 +50,12 @@ class Settings(BaseSettings):
             return ""
 
         for item in v.split(","):
-            if "=" not in item:
+            name, sep, url = item.partition("=")
+            if not sep:
                 raise ValueError(
                     f"Invalid format in services_config: '{item}'. Expected 'name=url'"
                 )
 
-            name, url = item.split("=", 1)
             if not name.strip() or not url.strip():
                 raise ValueError(f"Empty name or URL in: '{item}'")
 
@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 
 from app import __version__
 from app.checker import checker
@@ -15,15 +15,33 @@ from app.models import AppHealth, AppInfo, ServicesResponse
 
 # Background task for periodic checks
 async def periodic_health_check():
-    """Automatically check services every X seconds."""
+    """Automatically check services every X seconds.
+
+    Runs on a fixed schedule - check duration does not shift the next run.
+    If a check takes longer than the interval, missed ticks are skipped.
+    First check runs right at startup - warms up DNS cache, connection
+    pool and results cache before the first request arrives.
+    """
+    loop = asyncio.get_running_loop()
+    interval = settings.check_interval_seconds
+    next_deadline = loop.time()
     while True:
-        await asyncio.sleep(settings.check_interval_seconds)
+        delay = next_deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
         await checker.check_all()
 
+        # Move to the next tick that is still in the future
+        next_deadline += interval
+        now = loop.time()
+        if next_deadline <= now:
+            next_deadline += ((now - next_deadline) // interval + 1) * interval
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Lifecycle manager - starts background task."""
+    """Lifecycle manager - starts background task, closes HTTP session."""
+    checker.open()
     task = asyncio.create_task(periodic_health_check())
     yield
     task.cancel()
@@ -31,6 +49,9 @@ async def lifespan(app: FastAPI):
         await task
     except asyncio.CancelledError:
         pass
+    finally:
+        # Close session even if background task failed
+        await checker.aclose()
 
 
 app = FastAPI(
@@ -38,6 +59,8 @@ app = FastAPI(
     description="Simple service health monitoring tool for DevOps",
     version=__version__,
     lifespan=lifespan,
+    # orjson - much faster JSON encoding of long service lists
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -71,13 +94,20 @@ async def get_services() -> ServicesResponse:
     # Real service checking!
     results = await checker.check_all()
 
-    healthy_count = sum(1 for r in results if r.is_healthy)
+    # Count in a single pass (bool adds as 0/1)
+    total = 0
+    healthy = 0
+    for r in results:
+        total += 1
+        healthy += r.is_healthy
 
-    return ServicesResponse(
+    # Skip validation on construction only - FastAPI still validates
+    # the returned model against response_model when serializing
+    return ServicesResponse.model_construct(
         services=results,
-        total=len(results),
-        healthy=healthy_count,
-        unhealthy=len(results) - healthy_count,
+        total=total,
+        healthy=healthy,
+        unhealthy=total - healthy,
     )
 
 
@@ -91,8 +121,20 @@ async def trigger_check() -> ServicesResponse:
     return await get_services()
 
 
+# Prometheus metric headers
+_UP_HEAD = (
+    b"# HELP service_up Service health status (1=healthy, 0=unhealthy)\n"
+    b"# TYPE service_up gauge\n"
+)
+_RT_HEAD = (
+    b"\n"
+    b"# HELP service_response_time_ms Service response time in milliseconds\n"
+    b"# TYPE service_response_time_ms gauge\n"
+)
+
+
 @app.get("/metrics", response_class=PlainTextResponse)
-async def prometheus_metrics() -> str:
+async def prometheus_metrics() -> Response:
     """Prometheus-compatible metrics endpoint.
 
     Returns metrics in Prometheus text format:
@@ -111,28 +153,19 @@ async def prometheus_metrics() -> str:
     # Get current check results
     results = await checker.check_all()
 
-    # Build response in Prometheus format
-    lines = [
-        "# HELP service_up Service health status (1=healthy, 0=unhealthy)",
-        "# TYPE service_up gauge",
-    ]
+    # Build response in Prometheus format directly as bytes. Line prefixes
+    # (metric name + escaped label) are prebuilt by the checker.
+    up_prefix = checker.prom_up_prefix
+    rt_prefix = checker.prom_rt_prefix
 
+    buf = bytearray(_UP_HEAD)
     for r in results:
-        status = 1 if r.is_healthy else 0
-        lines.append(f'service_up{{service="{r.service_name}"}} {status}')
-
-    lines.extend(
-        [
-            "",
-            "# HELP service_response_time_ms Service response time in milliseconds",
-            "# TYPE service_response_time_ms gauge",
-        ]
-    )
+        buf += up_prefix[r.service_name]
+        buf += b"1\n" if r.is_healthy else b"0\n"
 
+    buf += _RT_HEAD
     for r in results:
-        lines.append(
-            f'service_response_time_ms{{service="{r.service_name}"}} '
-            f"{r.response_time_ms}"
-        )
+        buf += rt_prefix[r.service_name]
+        buf += b"%.2f\n" % r.response_time_ms
 
-    return "\n".join(lines)
+    return Response(content=bytes(buf), media_type="text/plain; version=0.0.4")